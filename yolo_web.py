@@ -6,10 +6,23 @@ import cv2
 from ultralytics import YOLO
 import torch
 import random
-from werkzeug.utils import secure_filename
 import base64
 from io import BytesIO
 import datetime
+import hashlib
+try:
+    import fcntl
+except ImportError:  # Windows 下只有单进程运行，不需要文件锁
+    fcntl = None
+import math
+import socket
+import ssl
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
 from flask_sqlalchemy import SQLAlchemy
 import openpyxl
 # 初始化 Flask 应用
@@ -18,6 +31,20 @@ app.secret_key = 'your_secret_key'  # 用于会话管理
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg'}
 
+# 识别接口的准入控制：每个进程同时推理的请求数、排队上限和排队等待时间（秒）
+app.config['INFERENCE_MAX_INFLIGHT'] = 1
+app.config['INFERENCE_MAX_QUEUE'] = 4
+app.config['INFERENCE_QUEUE_TIMEOUT'] = 10
+# 令牌桶限流（登录用户按 user_id，未登录按 IP）：每秒补充的令牌数、桶容量和最多保存的桶数
+app.config['RATE_LIMIT_PER_SECOND'] = 0.5
+app.config['RATE_LIMIT_BURST'] = 5
+app.config['RATE_LIMIT_MAX_KEYS'] = 10000
+# 上传文件按内容哈希存储：总大小上限（字节）、未引用文件保留时间、新文件保护时间和清理间隔（秒）
+app.config['UPLOAD_MAX_BYTES'] = 2 * 1024 * 1024 * 1024
+app.config['UPLOAD_MAX_AGE'] = 7 * 24 * 3600
+app.config['UPLOAD_GRACE_PERIOD'] = 300
+app.config['UPLOAD_COMPACT_INTERVAL'] = 600
+
 # 创建上传文件夹（如果不存在）
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
@@ -66,6 +93,182 @@ class PlantRecognition(db.Model):
         return f"Recognition('{self.user_id}', '{self.plant_id}', '{self.confidence}')"
 
 
+# 上传文件存储
+# 文件以 sha256 命名，存放在 uploads/ab/cd/<hash>.<ext>，相同图片只保存一份。
+# 先写入临时文件再 rename，并发请求不会读到写了一半的文件。
+# 引用计数为 recognitions 表中 image_path 相同的记录数，有引用的文件不会被清理；
+# 没有引用的文件（未登录用户上传、或识别结果不在 plantinfo 中）保留 UPLOAD_MAX_AGE，
+# 总大小超过 UPLOAD_MAX_BYTES 时从最旧的开始提前清理。
+COMPACT_LOCK_NAME = '.compact.lock'
+STORE_LOCK_NAME = '.store.lock'
+
+
+def upload_temp_dir():
+    path = os.path.join(app.config['UPLOAD_FOLDER'], 'tmp')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+@contextmanager
+def upload_store_lock(exclusive=False):
+    """上传存储锁：请求从保存文件到写入识别记录期间持有共享锁，清理删除文件时持有排他锁"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(app.config['UPLOAD_FOLDER'], STORE_LOCK_NAME), 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+
+
+def store_upload(stream, ext):
+    """将上传内容写入内容寻址存储，返回文件路径"""
+    digest = hashlib.sha256()
+    fd, temp_path = tempfile.mkstemp(dir=upload_temp_dir())
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in iter(lambda: stream.read(64 * 1024), b''):
+                digest.update(chunk)
+                f.write(chunk)
+        name = digest.hexdigest()
+        shard_dir = os.path.join(app.config['UPLOAD_FOLDER'], name[:2], name[2:4])
+        blob_path = os.path.join(shard_dir, f"{name}.{ext}")
+        # 已有相同文件时直接覆盖，内容不变且修改时间更新；
+        # 空目录可能刚被清理线程删除，重新创建后再试
+        for attempt in range(3):
+            os.makedirs(shard_dir, exist_ok=True)
+            try:
+                os.replace(temp_path, blob_path)
+                break
+            except FileNotFoundError:
+                if attempt == 2:
+                    raise
+        return blob_path
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def upload_ref_counts():
+    """返回每个上传文件被识别记录引用的次数"""
+    rows = db.session.query(PlantRecognition.image_path, db.func.count(PlantRecognition.id)) \
+        .filter(PlantRecognition.image_path.isnot(None)) \
+        .group_by(PlantRecognition.image_path).all()
+    return {os.path.normpath(path): count for path, count in rows}
+
+
+def compact_uploads():
+    """清理未被引用且过期的文件，超出大小上限时从最旧的开始清理"""
+    now = time.time()
+    grace = app.config['UPLOAD_GRACE_PERIOD']
+
+    # 清理残留的临时文件
+    temp_dir = upload_temp_dir()
+    for name in os.listdir(temp_dir):
+        path = os.path.join(temp_dir, name)
+        try:
+            if now - os.path.getmtime(path) > grace:
+                os.remove(path)
+        except OSError:
+            pass
+
+    try:
+        ref_counts = upload_ref_counts()
+    except Exception as e:
+        # 读不到引用计数时不能判断哪些文件可以删除，本轮只清理临时文件
+        print(f"读取识别记录失败，跳过清理: {e}")
+        db.session.rollback()
+        return
+
+    blobs = []
+    total_size = 0
+    for root, dirs, files in os.walk(app.config['UPLOAD_FOLDER']):
+        dirs[:] = [d for d in dirs if d != 'tmp']
+        for name in files:
+            if name in (COMPACT_LOCK_NAME, STORE_LOCK_NAME):
+                continue
+            path = os.path.normpath(os.path.join(root, name))
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total_size += stat.st_size
+            if not ref_counts.get(path) and now - stat.st_mtime > grace:
+                blobs.append((stat.st_mtime, stat.st_size, path, stat.st_ino))
+
+    # 持有排他锁时没有请求处在保存文件和写入识别记录之间。
+    # 扫描之后文件可能被相同内容的上传替换或被新记录引用，删除前重新检查。
+    removed = 0
+    with upload_store_lock(exclusive=True):
+        try:
+            ref_counts = upload_ref_counts()
+        except Exception as e:
+            print(f"读取识别记录失败，跳过清理: {e}")
+            db.session.rollback()
+            return
+        for mtime, size, path, ino in sorted(blobs):
+            expired = now - mtime > app.config['UPLOAD_MAX_AGE']
+            if not expired and total_size <= app.config['UPLOAD_MAX_BYTES']:
+                continue
+            try:
+                stat = os.stat(path)
+                if ref_counts.get(path) or stat.st_ino != ino or stat.st_mtime != mtime:
+                    continue
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            removed += 1
+
+        # 删除空的分片目录
+        upload_root = os.path.normpath(app.config['UPLOAD_FOLDER'])
+        for root, dirs, files in os.walk(upload_root, topdown=False):
+            if root == upload_root or root == os.path.normpath(temp_dir) or files:
+                continue
+            try:
+                os.rmdir(root)
+            except OSError:
+                pass
+    if removed:
+        print(f"已清理 {removed} 个上传文件")
+
+
+def upload_compactor():
+    # 每个 gunicorn worker 都会启动该线程，用文件锁保证同一时间只有一个进程在清理
+    lock_path = os.path.join(app.config['UPLOAD_FOLDER'], COMPACT_LOCK_NAME)
+    while True:
+        time.sleep(app.config['UPLOAD_COMPACT_INTERVAL'])
+        with open(lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue
+            with app.app_context():
+                try:
+                    compact_uploads()
+                except Exception as e:
+                    print(f"清理上传文件失败: {e}")
+                finally:
+                    db.session.remove()
+
+
+upload_compactor_started = False
+upload_compactor_lock = threading.Lock()
+
+
+@app.before_request
+def start_upload_compactor():
+    # 收到第一个请求时才启动清理线程，导入模块（flask shell、脚本）不会删除文件
+    global upload_compactor_started
+    if upload_compactor_started:
+        return
+    with upload_compactor_lock:
+        if not upload_compactor_started:
+            threading.Thread(target=upload_compactor, daemon=True).start()
+            upload_compactor_started = True
+
+
 # 加载 YOLO 模型
 model_path = "best.pt"  # 确保你的模型文件在此目录下
 if not os.path.exists(model_path):
@@ -102,6 +305,107 @@ def load_plant_info():
 
 load_plant_info()
 
+# 识别接口准入控制
+# 推理槽位与排队数按进程限制，超出时立即返回 503，避免请求堆积到客户端超时。
+# 使用多线程 worker 运行（如 gunicorn -w 2 --threads 8），推理最多占用
+# INFLIGHT + QUEUE 个线程，其余线程留给登录、查询和静态页面。
+inference_slots = threading.BoundedSemaphore(app.config['INFERENCE_MAX_INFLIGHT'])
+inference_lock = threading.Lock()
+inference_waiting = 0
+
+rate_limit_lock = threading.Lock()
+rate_limit_buckets = OrderedDict()  # 限流键 -> (剩余令牌数, 上次更新时间)，按最近使用排序
+
+
+def rate_limit_key():
+    user_id = session.get('user_id')
+    if user_id is not None:
+        return ('user', user_id)
+    return ('ip', request.remote_addr)
+
+
+def take_token(key):
+    """从令牌桶中取一个令牌，成功返回 0，否则返回需要等待的秒数"""
+    rate = app.config['RATE_LIMIT_PER_SECOND']
+    burst = app.config['RATE_LIMIT_BURST']
+    now = time.monotonic()
+    with rate_limit_lock:
+        # 先取出再放回，使该键移到末尾
+        tokens, updated = rate_limit_buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+        wait = 0 if tokens >= 1 else (1 - tokens) / rate
+        rate_limit_buckets[key] = (tokens - 1 if tokens >= 1 else tokens, now)
+        # 超过上限时丢弃最久未使用的桶
+        while len(rate_limit_buckets) > app.config['RATE_LIMIT_MAX_KEYS']:
+            rate_limit_buckets.popitem(last=False)
+        return wait
+
+
+def client_disconnected():
+    """检查客户端是否已经断开连接（gunicorn 和 werkzeug 开发服务器）
+
+    需要先读完请求体，否则读到的是尚未读取的上传数据而不是连接关闭。
+    """
+    sock = request.environ.get('gunicorn.socket') or request.environ.get('werkzeug.socket')
+    # 服务器自己处理 TLS 时 SSLSocket.recv 不支持 MSG_PEEK，无法检测
+    if sock is None or isinstance(sock, ssl.SSLSocket):
+        return False
+    try:
+        timeout = sock.gettimeout()
+        sock.setblocking(False)
+        try:
+            return sock.recv(1, socket.MSG_PEEK) == b''
+        finally:
+            sock.settimeout(timeout)
+    except (BlockingIOError, InterruptedError):
+        return False
+    except OSError:
+        return True
+
+
+def overloaded(status, retry_after, message):
+    response = jsonify({"status": "error", "message": message})
+    response.status_code = status
+    response.headers['Retry-After'] = str(max(1, math.ceil(retry_after)))
+    return response
+
+
+def inference_admission(view):
+    """识别接口的限流与排队控制"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        global inference_waiting
+        wait = take_token(rate_limit_key())
+        if wait:
+            return overloaded(429, wait, "请求过于频繁，请稍后再试")
+
+        # 排队前读完上传内容，之后才能检测客户端是否断开
+        request.files
+
+        if not inference_slots.acquire(blocking=False):
+            with inference_lock:
+                if inference_waiting >= app.config['INFERENCE_MAX_QUEUE']:
+                    return overloaded(503, app.config['INFERENCE_QUEUE_TIMEOUT'], "服务器繁忙，请稍后再试")
+                inference_waiting += 1
+            try:
+                acquired = inference_slots.acquire(timeout=app.config['INFERENCE_QUEUE_TIMEOUT'])
+            finally:
+                with inference_lock:
+                    inference_waiting -= 1
+            if not acquired:
+                return overloaded(503, app.config['INFERENCE_QUEUE_TIMEOUT'], "服务器繁忙，请稍后再试")
+
+        try:
+            # 排队期间客户端已断开则不再推理；已开始的推理无法中断。
+            # 499 沿用 nginx 的"客户端关闭连接"状态码，响应不会被客户端收到，只用于访问日志
+            if client_disconnected():
+                return '', 499
+            return view(*args, **kwargs)
+        finally:
+            inference_slots.release()
+    return wrapper
+
+
 def allowed_file(filename):
     return '.' in filename and \
         filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
@@ -142,15 +446,33 @@ def process_image(image_data):
         # 将 base64 图像数据转换为图像
         image_bytes = base64.b64decode(image_data)
         image = Image.open(BytesIO(image_bytes))
-        image_path = os.path.join(app.config['UPLOAD_FOLDER'], 'temp.jpg')
-        image.save(image_path)
-
-        # 分类图像
-        return classify_image(image_path)
+        buffer = BytesIO()
+        image.convert('RGB').save(buffer, format='JPEG')
+        buffer.seek(0)
+        with upload_store_lock():
+            image_path = store_upload(buffer, 'jpg')
+
+            # 分类图像
+            return classify_image(image_path)
     except Exception as e:
         print(f"处理图像失败: {e}")
         return None
 
+def record_recognition(image_path, result):
+    """保存识别记录，记录中的图片不会被清理"""
+    user_id = session.get('user_id')
+    if user_id is None:
+        return
+    try:
+        plant = Plant.query.filter_by(Name=result["class_name"]).first()
+        if plant:
+            db.session.add(PlantRecognition(user_id=user_id, image_path=image_path,
+                                            plant_id=plant.PlantID, confidence=result["confidence"]))
+            db.session.commit()
+    except Exception as e:
+        print(f"保存识别记录失败: {e}")
+        db.session.rollback()
+
 # 路由 - 登录页面
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -237,6 +559,7 @@ def Personal_Information():
 
 # # 路由 - 植物识别 API
 @app.route('/api/plant-identification1', methods=['POST'])
+@inference_admission
 def plant_identification1():
     if 'file' not in request.files:
         return jsonify({"error": "未上传文件"}), 400
@@ -247,11 +570,13 @@ def plant_identification1():
 
     if file and allowed_file(file.filename):
         # 保存上传的文件
-        filename = secure_filename(file.filename)
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
-        # 分类图像
-        result = classify_image(file_path)
+        ext = file.filename.rsplit('.', 1)[1].lower()
+        with upload_store_lock():
+            file_path = store_upload(file.stream, ext)
+            # 分类图像
+            result = classify_image(file_path)
+            if result:
+                record_recognition(file_path, result)
         if result:
             return jsonify({
                 "status": "success",